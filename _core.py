@@ -0,0 +1,56 @@
+"""
+Hot-path helpers for the difficulty manager
+
+The per-answer update runs on every submission, so it is written against a
+preallocated ring buffer and compiled with Numba when numba/numpy are
+installed. Without them the same function runs as pure Python over a plain
+list buffer.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+
+def make_buffer(window: int):
+    """Allocate a zeroed ring buffer of the given window size"""
+    if np is not None:
+        return np.zeros(window, dtype=np.uint8)
+    return [0] * window
+
+
+def _update(buf, cursor, filled, correct_sum, is_correct, window,
+            promote_t, demote_t, idx, max_idx):
+    """Advance the performance ring buffer and apply the level thresholds
+
+    Returns (cursor, filled, correct_sum, idx, changed) where changed is
+    +1 for a promotion, -1 for a demotion and 0 otherwise.
+    """
+    if filled == window:
+        correct_sum -= buf[cursor]
+    else:
+        filled += 1
+    buf[cursor] = is_correct
+    correct_sum += is_correct
+    cursor = (cursor + 1) % window
+
+    changed = 0
+    if filled >= window:
+        accuracy = correct_sum / filled
+        if accuracy >= promote_t and idx < max_idx:
+            idx += 1
+            changed = 1
+        elif accuracy <= demote_t and idx > 0:
+            idx -= 1
+            changed = -1
+
+    return cursor, filled, correct_sum, idx, changed
+
+
+if njit is not None:
+    update = njit(cache=True)(_update)
+else:
+    update = _update
@@ -2,104 +2,131 @@
 Difficulty Manager for adaptive AI difficulty adjustment
 """
 
-from typing import List
+import _core
 
 class DifficultyManager:
+    # The 3-level ladder never changes at runtime, so the transitions are
+    # baked into dicts instead of being rediscovered with list scans
+    _LEVEL_INDEX = {'easy': 0, 'medium': 1, 'hard': 2}
+    _NEXT = {'easy': 'medium', 'medium': 'hard', 'hard': None}
+    _PREV = {'easy': None, 'medium': 'easy', 'hard': 'medium'}
+
     def __init__(self):
-        self.current_level = 'easy'
         self.levels = ['easy', 'medium', 'hard']
-        self.recent_performance: List[bool] = []  # Track recent answers (True = correct, False = incorrect)
+        self._current_index = 0  # Index into self.levels; source of truth for the level
         self.performance_window = 5  # Number of recent answers to consider
+        # Recent answers live in a preallocated ring buffer (1 = correct,
+        # 0 = incorrect); _core.update advances it in compiled code when
+        # Numba is available
+        self._buf = _core.make_buffer(self.performance_window)
+        self._cursor = 0  # Next write position in the ring buffer
+        self._filled = 0  # Number of answers currently in the window
+        self._correct_in_window = 0  # Running count of correct answers in the window
         self.promotion_threshold = 0.8  # 80% accuracy to move up
         self.demotion_threshold = 0.4  # Below 40% accuracy to move down
-        
+        # Memoized get_difficulty_info result, keyed on the state it reflects
+        self._info_cache_key = None
+        self._info_cache = None
+
+    @property
+    def current_level(self) -> str:
+        """Name of the current difficulty level"""
+        return self.levels[self._current_index]
+
+    @current_level.setter
+    def current_level(self, level: str):
+        self._current_index = self._LEVEL_INDEX[level]
+
     def update_difficulty(self, is_correct: bool):
         """Update difficulty based on the latest answer"""
-        # Add the latest result to performance tracking
-        self.recent_performance.append(is_correct)
-        
-        # Keep only the most recent results within the window
-        if len(self.recent_performance) > self.performance_window:
-            self.recent_performance.pop(0)
-        
-        # Only adjust difficulty if we have enough data
-        if len(self.recent_performance) >= self.performance_window:
-            accuracy = sum(self.recent_performance) / len(self.recent_performance)
-            
-            current_index = self.levels.index(self.current_level)
-            
-            # Check for promotion (move to harder level)
-            if accuracy >= self.promotion_threshold and current_index < len(self.levels) - 1:
-                self.current_level = self.levels[current_index + 1]
-                self._reset_performance_tracking()
+        (self._cursor, self._filled, self._correct_in_window,
+         new_index, changed) = _core.update(
+            self._buf, self._cursor, self._filled, self._correct_in_window,
+            int(is_correct), self.performance_window,
+            self.promotion_threshold, self.demotion_threshold,
+            self._current_index, len(self.levels) - 1)
+
+        if changed:
+            self._current_index = new_index
+            self._reset_performance_tracking()
+            if changed > 0:
                 print(f"Difficulty increased to: {self.current_level}")
-            
-            # Check for demotion (move to easier level)
-            elif accuracy <= self.demotion_threshold and current_index > 0:
-                self.current_level = self.levels[current_index - 1]
-                self._reset_performance_tracking()
+            else:
                 print(f"Difficulty decreased to: {self.current_level}")
-    
+
     def _reset_performance_tracking(self):
         """Reset performance tracking after level change"""
         # Keep some recent performance to avoid rapid oscillation
-        if len(self.recent_performance) > 2:
-            self.recent_performance = self.recent_performance[-2:]
-        else:
-            self.recent_performance = []
-    
+        kept = []
+        if self._filled > 2:
+            for offset in (2, 1):
+                kept.append(int(self._buf[(self._cursor - offset) % self.performance_window]))
+
+        self._buf = _core.make_buffer(self.performance_window)
+        for i, result in enumerate(kept):
+            self._buf[i] = result
+        self._cursor = len(kept) % self.performance_window
+        self._filled = len(kept)
+        self._correct_in_window = sum(kept)
+
     def get_current_accuracy(self) -> float:
         """Get current accuracy percentage"""
-        if not self.recent_performance:
+        if not self._filled:
             return 0.0
-        return (sum(self.recent_performance) / len(self.recent_performance)) * 100
-    
+        return (self._correct_in_window / self._filled) * 100
+
     def get_difficulty_info(self) -> dict:
         """Get detailed information about current difficulty state"""
-        return {
+        # Rebuild the dict only when the underlying state has changed
+        key = (self._current_index, self._filled, self._correct_in_window)
+        if key == self._info_cache_key:
+            return self._info_cache
+
+        self._info_cache = {
             'current_level': self.current_level,
-            'level_index': self.levels.index(self.current_level),
+            'level_index': self._current_index,
             'total_levels': len(self.levels),
             'recent_accuracy': self.get_current_accuracy(),
-            'questions_in_window': len(self.recent_performance),
+            'questions_in_window': self._filled,
             'window_size': self.performance_window
         }
-    
+        self._info_cache_key = key
+        return self._info_cache
+
     def force_level(self, level: str):
         """Force set the difficulty level (for testing or manual adjustment)"""
-        if level in self.levels:
-            self.current_level = level
-            self.recent_performance = []
+        if level in self._LEVEL_INDEX:
+            self._current_index = self._LEVEL_INDEX[level]
+            self._clear_window()
             print(f"Difficulty manually set to: {self.current_level}")
         else:
             print(f"Invalid difficulty level: {level}")
-    
+
     def reset(self):
         """Reset difficulty manager to initial state"""
-        self.current_level = 'easy'
-        self.recent_performance = []
+        self._current_index = 0
+        self._clear_window()
         print("Difficulty manager reset to easy level")
-    
+
+    def _clear_window(self):
+        """Empty the performance window"""
+        self._buf = _core.make_buffer(self.performance_window)
+        self._cursor = 0
+        self._filled = 0
+        self._correct_in_window = 0
+
     def can_promote(self) -> bool:
         """Check if promotion to next level is possible"""
-        current_index = self.levels.index(self.current_level)
-        return current_index < len(self.levels) - 1
-    
+        return self._NEXT[self.current_level] is not None
+
     def can_demote(self) -> bool:
         """Check if demotion to previous level is possible"""
-        current_index = self.levels.index(self.current_level)
-        return current_index > 0
-    
+        return self._PREV[self.current_level] is not None
+
     def get_next_level(self) -> str:
         """Get the next difficulty level (for promotion)"""
-        current_index = self.levels.index(self.current_level)
-        if current_index < len(self.levels) - 1:
-            return self.levels[current_index + 1]
-        return self.current_level
-    
+        return self._NEXT[self.current_level] or self.current_level
+
     def get_previous_level(self) -> str:
         """Get the previous difficulty level (for demotion)"""
-        current_index = self.levels.index(self.current_level)
-        if current_index > 0:
-            return self.levels[current_index - 1]
-        return self.current_level
+        return self._PREV[self.current_level] or self.current_level
@@ -6,10 +6,6 @@ Main entry point for the Adaptive AI Quiz Game
 import tkinter as tk
 from tkinter import messagebox
 import sys
-import os
-
-# Add current directory to path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from quiz_game import QuizGame
 
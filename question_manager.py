@@ -5,55 +5,102 @@ Question Manager for handling question loading and selection
 import json
 import os
 import random
-from typing import Dict, List, Optional
+import tempfile
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, Optional
+
+# Prefer orjson's C-level encoder for writing question files; fall back to
+# the stdlib when it isn't installed
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Decode question files straight to the inner question list; the hook unwraps
+# the outer {"questions": [...]} dict during parsing instead of allocating it
+_DECODER = json.JSONDecoder(
+    object_hook=lambda d: d['questions'] if isinstance(d.get('questions'), list) else d)
 
 class QuestionManager:
     def __init__(self):
-        self.questions: Dict[str, List[Dict]] = {
-            'easy': [],
-            'medium': [],
-            'hard': []
+        # Pools are stored as tuples after load: immutable, contiguous, and
+        # indexed in O(1); _counts avoids re-measuring them on every pick.
+        # None marks a level whose file hasn't been parsed yet
+        self.questions: Dict[str, Optional[tuple]] = {
+            'easy': None,
+            'medium': None,
+            'hard': None
         }
+        self._counts: Dict[str, int] = {'easy': 0, 'medium': 0, 'hard': 0}
+        # Pre-shuffled serving queues, rebuilt only when a rotation is
+        # exhausted; _last_served guards against boundary duplicates
+        self._queues: Dict[str, Optional[deque]] = {}
+        self._last_served: Dict[str, Optional[Dict]] = {}
+        # Levels whose in-memory pool is ahead of the file on disk
+        self._dirty_levels: set = set()
         self.data_dir = "data"
         
     def load_questions(self) -> bool:
-        """Load questions from JSON files"""
+        """Prepare question storage and load the starting difficulty level"""
         try:
             # Create data directory if it doesn't exist
-            if not os.path.exists(self.data_dir):
-                os.makedirs(self.data_dir)
-            
-            # Load questions for each difficulty level
-            for level in ['easy', 'medium', 'hard']:
-                filename = f"questions_{level}.json"
-                filepath = os.path.join(self.data_dir, filename)
-                
-                if os.path.exists(filepath):
-                    with open(filepath, 'r', encoding='utf-8') as file:
-                        questions_data = json.load(file)
-                        self.questions[level] = questions_data.get('questions', [])
-                else:
-                    # Create default questions if file doesn't exist
-                    self._create_default_questions(level, filepath)
-            
+            os.makedirs(self.data_dir, exist_ok=True)
+
+            # Only the starting level is parsed up front; medium/hard files
+            # load lazily on first request for that difficulty
+            self._load_level('easy')
+
             return True
-            
+
         except Exception as e:
             print(f"Error loading questions: {str(e)}")
             return False
+
+    def _load_level(self, level: str):
+        """Load a single difficulty level's questions from its JSON file"""
+        filename = f"questions_{level}.json"
+        filepath = os.path.join(self.data_dir, filename)
+
+        # Read the file in one go and fall back to defaults rather than
+        # stat-ing it first
+        try:
+            pool = _DECODER.decode(Path(filepath).read_text(encoding='utf-8'))
+            if isinstance(pool, dict):  # file without the "questions" wrapper
+                pool = pool.get('questions', [])
+            self.questions[level] = tuple(pool)
+            self._counts[level] = len(self.questions[level])
+        except FileNotFoundError:
+            # Create default questions if file doesn't exist
+            self._create_default_questions(level, filepath)
+
+    def _ensure_loaded(self, level: str):
+        """Load a level's question file on first access"""
+        if self.questions.get(level) is None:
+            self._load_level(level)
     
     def _create_default_questions(self, level: str, filepath: str):
         """Create default questions for a difficulty level"""
         default_questions = self._get_default_questions(level)
-        
-        try:
-            with open(filepath, 'w', encoding='utf-8') as file:
-                json.dump(default_questions, file, indent=2, ensure_ascii=False)
-            
-            self.questions[level] = default_questions.get('questions', [])
-            
-        except Exception as e:
-            print(f"Error creating default questions for {level}: {str(e)}")
+
+        # Serve the defaults straight from memory; the JSON file only exists
+        # so users can edit it, so write it in the background instead of
+        # blocking first launch on an encode + disk write
+        self.questions[level] = tuple(default_questions.get('questions', []))
+        self._counts[level] = len(self.questions[level])
+
+        def _write():
+            try:
+                Path(filepath).write_bytes(_dumps(default_questions))
+            except OSError as e:
+                print(f"Error creating default questions for {level}: {str(e)}")
+
+        threading.Thread(target=_write, daemon=True).start()
     
     def _get_default_questions(self, level: str) -> Dict:
         """Get default questions for each difficulty level"""
@@ -168,34 +215,88 @@ class QuestionManager:
     
     def get_random_question(self, difficulty: str) -> Optional[Dict]:
         """Get a random question from the specified difficulty level"""
-        if difficulty not in self.questions or not self.questions[difficulty]:
+        if difficulty not in self.questions:
             return None
-        
-        return random.choice(self.questions[difficulty])
+
+        self._ensure_loaded(difficulty)
+        if not self._counts.get(difficulty, 0):
+            return None
+
+        queue = self._queues.get(difficulty)
+        if not queue:
+            queue = self._reshuffle(difficulty)
+
+        question = queue.popleft()
+        self._last_served[difficulty] = question
+        return question
+
+    def _reshuffle(self, difficulty: str) -> deque:
+        """Build a freshly shuffled serving queue for a difficulty level"""
+        pool = list(self.questions[difficulty])
+        random.shuffle(pool)
+
+        # Don't let a new rotation start with the question just served
+        if len(pool) > 1 and pool[0] is self._last_served.get(difficulty):
+            pool[0], pool[-1] = pool[-1], pool[0]
+
+        queue = deque(pool)
+        self._queues[difficulty] = queue
+        return queue
     
     def get_question_count(self, difficulty: str) -> int:
         """Get the number of questions for a difficulty level"""
-        return len(self.questions.get(difficulty, []))
+        if difficulty not in self.questions:
+            return 0
+        self._ensure_loaded(difficulty)
+        return self._counts[difficulty]
     
-    def add_question(self, difficulty: str, question_data: Dict) -> bool:
-        """Add a new question to the specified difficulty level"""
+    def add_question(self, difficulty: str, question_data: Dict, flush: bool = True) -> bool:
+        """Add a new question to the specified difficulty level
+
+        With flush=False the question is only added in memory and the level
+        is marked dirty; call flush_pending() later to coalesce several adds
+        into a single file write.
+        """
         try:
             if difficulty not in self.questions:
                 return False
-            
-            # Add to memory
-            self.questions[difficulty].append(question_data)
-            
-            # Save to file
-            filename = f"questions_{difficulty}.json"
-            filepath = os.path.join(self.data_dir, filename)
-            
-            questions_data = {"questions": self.questions[difficulty]}
-            with open(filepath, 'w', encoding='utf-8') as file:
-                json.dump(questions_data, file, indent=2, ensure_ascii=False)
-            
+
+            self._ensure_loaded(difficulty)
+
+            # Add to memory (rebuild the tuple and bump the cached count);
+            # drop the serving queue so the new question joins the next rotation
+            self.questions[difficulty] = self.questions[difficulty] + (question_data,)
+            self._counts[difficulty] = len(self.questions[difficulty])
+            self._queues[difficulty] = None
+            self._dirty_levels.add(difficulty)
+
+            if flush:
+                return self.flush_pending()
             return True
-            
+
         except Exception as e:
             print(f"Error adding question: {str(e)}")
             return False
+
+    def flush_pending(self) -> bool:
+        """Write every dirty level's question pool back to its file"""
+        try:
+            for level in list(self._dirty_levels):
+                filepath = os.path.join(self.data_dir, f"questions_{level}.json")
+                self._write_level_file(level, filepath)
+                self._dirty_levels.discard(level)
+
+            return True
+
+        except Exception as e:
+            print(f"Error writing question files: {str(e)}")
+            return False
+
+    def _write_level_file(self, level: str, filepath: str):
+        """Atomically rewrite a level's question file (temp file + rename)"""
+        questions_data = {"questions": list(self.questions[level])}
+        with tempfile.NamedTemporaryFile(dir=self.data_dir, delete=False) as tmp:
+            tmp.write(_dumps(questions_data))
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp.name, filepath)
@@ -5,6 +5,7 @@ Main Quiz Game class handling the GUI and game logic
 import tkinter as tk
 from tkinter import ttk, messagebox
 import random
+from itertools import zip_longest
 from typing import Dict, List, Optional
 
 from question_manager import QuestionManager
@@ -12,6 +13,10 @@ from difficulty_manager import DifficultyManager
 from user_progress import UserProgress
 
 class QuizGame:
+    MAX_OPTIONS = 4  # Size of the reusable answer-button pool
+    SCORE_MULTIPLIER = {'easy': 10, 'medium': 15, 'hard': 20}  # Points per correct answer
+    _LEVEL_DISPLAY = {'easy': 'Easy', 'medium': 'Medium', 'hard': 'Hard'}
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.question_manager = QuestionManager()
@@ -20,11 +25,17 @@ class QuizGame:
         
         # Game state variables
         self.current_question: Optional[Dict] = None
+        self._correct_index = -1  # Index of the correct option for the current question
         self.selected_answer = tk.StringVar()
         self.game_active = False
         self.questions_answered = 0
         self.correct_answers = 0
-        
+        self.current_score = 0
+
+        # Pending statistics text, flushed to the labels in one idle-time pass
+        self._stats_dirty = False
+        self._pending_stats: Dict[str, str] = {}
+
         # Initialize the GUI
         self.setup_gui()
         self.load_initial_data()
@@ -85,9 +96,19 @@ class QuizGame:
         self.answers_frame = ttk.Frame(self.question_frame)
         self.answers_frame.grid(row=1, column=0, sticky="WE")
         self.answers_frame.columnconfigure(0, weight=1)
+        # Fix the frame's height and stop child changes from propagating, so
+        # showing/hiding answer buttons doesn't recompute the whole layout
+        self.answers_frame.configure(height=140)
+        self.answers_frame.grid_propagate(False)
         
-        # Answer radio buttons (will be created dynamically)
+        # Answer radio buttons: a fixed pool created once and reused for every
+        # question, avoiding Tk widget destroy/create churn between questions
         self.answer_buttons: List[ttk.Radiobutton] = []
+        for i in range(self.MAX_OPTIONS):
+            button = ttk.Radiobutton(self.answers_frame, variable=self.selected_answer)
+            button.grid(row=i, column=0, sticky=tk.W, pady=2)
+            button.grid_remove()
+            self.answer_buttons.append(button)
         
         # Feedback label
         self.feedback_label = ttk.Label(self.question_frame, text="", 
@@ -171,28 +192,34 @@ class QuizGame:
     
     def display_question(self):
         """Display the current question and answer options"""
-        if not self.current_question:
+        question = self.current_question
+        if not question:
             return
-        
+
         # Set question text
-        self.question_label.configure(text=self.current_question['question'])
-        
-        # Clear previous answer buttons
-        for button in self.answer_buttons:
-            button.destroy()
-        self.answer_buttons.clear()
+        self.question_label.configure(text=question['question'])
         
         # Reset selected answer
         self.selected_answer.set("")
-        
-        # Create new answer buttons
-        options = self.current_question['options']
-        for i, option in enumerate(options):
-            button = ttk.Radiobutton(self.answers_frame, text=option, 
-                                   variable=self.selected_answer, value=option)
-            button.grid(row=i, column=0, sticky=tk.W, pady=2)
-            self.answer_buttons.append(button)
-        
+
+        # Reuse the pooled answer buttons: update text/value for the options
+        # in play and hide any leftover slots. Buttons carry the option index
+        # so answer checking compares ints instead of option strings
+        options = question['options']
+        correct_answer = question['correct_answer']
+        self._correct_index = options.index(correct_answer) if correct_answer in options else -1
+        for i, (option, button) in enumerate(zip_longest(options, self.answer_buttons)):
+            if button is None:
+                break
+            if option is None:
+                button.grid_remove()
+            else:
+                button.configure(text=option, value=str(i))
+                button.grid()
+
+        # One geometry pass for the whole batch of grid changes
+        self.answers_frame.update_idletasks()
+
         # Enable submit button, disable next button
         self.submit_button.configure(state=tk.NORMAL)
         self.next_button.configure(state=tk.DISABLED)
@@ -202,31 +229,35 @@ class QuizGame:
     
     def submit_answer(self):
         """Submit and check the current answer"""
-        if not self.selected_answer.get():
+        # Hoist the Tcl call and dict lookups into locals; this runs on
+        # every answer
+        selected = self.selected_answer.get()
+        if not selected:
             messagebox.showwarning("Warning", "Please select an answer before submitting.")
             return
-        
-        if not self.current_question:
+
+        question = self.current_question
+        if not question:
             return
-        
-        # Check if answer is correct
-        is_correct = self.selected_answer.get() == self.current_question['correct_answer']
-        
+
+        # Check if answer is correct (selected holds the option's index)
+        correct_answer = question['correct_answer']
+        is_correct = int(selected) == self._correct_index
+
         # Update counters
         self.questions_answered += 1
         if is_correct:
             self.correct_answers += 1
-        
+
         # Show feedback
         if is_correct:
             self.feedback_label.configure(text="✓ Correct!", foreground="green")
         else:
-            correct_answer = self.current_question['correct_answer']
             self.feedback_label.configure(
-                text=f"✗ Incorrect! The correct answer was: {correct_answer}", 
+                text=f"✗ Incorrect! The correct answer was: {correct_answer}",
                 foreground="red"
             )
-        
+
         # Update difficulty based on performance
         self.difficulty_manager.update_difficulty(is_correct)
         
@@ -245,29 +276,53 @@ class QuizGame:
         self.load_next_question()
     
     def update_statistics(self):
-        """Update the statistics display"""
+        """Queue a statistics refresh, coalescing back-to-back updates"""
+        pending = self._pending_stats
+
         # Update level
-        level_display = self.difficulty_manager.current_level.capitalize()
-        self.level_label.configure(text=level_display)
-        
+        pending['level'] = self._LEVEL_DISPLAY[self.difficulty_manager.current_level]
+
         # Update questions count
-        self.questions_count_label.configure(text=str(self.questions_answered))
-        
+        pending['questions'] = str(self.questions_answered)
+
         # Update accuracy
         if self.questions_answered > 0:
             accuracy = (self.correct_answers / self.questions_answered) * 100
-            self.accuracy_label.configure(text=f"{accuracy:.1f}%")
+            pending['accuracy'] = f"{accuracy:.1f}%"
         else:
-            self.accuracy_label.configure(text="0%")
-        
+            pending['accuracy'] = "0%"
+
         # Update score (could be more sophisticated)
-        score = self.correct_answers * 10
-        if self.difficulty_manager.current_level == 'medium':
-            score = self.correct_answers * 15
-        elif self.difficulty_manager.current_level == 'hard':
-            score = self.correct_answers * 20
-        
-        self.score_label.configure(text=str(score))
+        score = self.correct_answers * self.SCORE_MULTIPLIER[self.difficulty_manager.current_level]
+        self.current_score = score
+        pending['score'] = str(score)
+
+        # Schedule a single idle-time flush; repeat calls before it runs
+        # just overwrite the pending values
+        if not self._stats_dirty:
+            self._stats_dirty = True
+            self.root.after_idle(self._flush_stats)
+
+    def _flush_stats(self):
+        """Write the pending statistics text to the labels in one pass"""
+        labels = {
+            'level': self.level_label,
+            'questions': self.questions_count_label,
+            'accuracy': self.accuracy_label,
+            'score': self.score_label
+        }
+        for key, text in self._pending_stats.items():
+            self._set_label_text(labels[key], text)
+
+        self._pending_stats.clear()
+        self._stats_dirty = False
+
+    @staticmethod
+    def _set_label_text(label: ttk.Label, text: str):
+        """Set a label's text, skipping the configure call when unchanged"""
+        # Redundant configure calls still schedule Tk repaints, so avoid them
+        if label.cget('text') != text:
+            label.configure(text=text)
     
     def save_progress(self):
         """Save current progress to file"""
@@ -276,7 +331,7 @@ class QuizGame:
                 'current_level': self.difficulty_manager.current_level,
                 'questions_answered': self.questions_answered,
                 'correct_answers': self.correct_answers,
-                'total_score': int(self.score_label.cget('text'))
+                'total_score': self.current_score
             }
             self.user_progress.save_stats(stats)
         except Exception as e:
@@ -293,10 +348,10 @@ class QuizGame:
         self.question_label.configure(text="Click 'Start Quiz' to begin!")
         self.feedback_label.configure(text="")
         
-        # Clear answer buttons
+        # Hide answer buttons
         for button in self.answer_buttons:
-            button.destroy()
-        self.answer_buttons.clear()
+            button.grid_remove()
+        self.answers_frame.update_idletasks()
         
         # Reset button states
         self.start_button.configure(state=tk.NORMAL)
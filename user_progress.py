@@ -2,122 +2,321 @@
 User Progress Manager for tracking and persisting user statistics
 """
 
+import atexit
+import copy
 import json
+import mmap
 import os
+import time
+from dataclasses import asdict, dataclass
 from typing import Dict, Optional
 from datetime import datetime
 
+# Codec for the stats file, best available first: msgspec compiles its
+# encoder/decoder once at import (the decoder is typed to the dict shape the
+# rest of the module works with), orjson is the next-fastest, and the stdlib
+# always works
+try:
+    import msgspec
+
+    _ENCODER = msgspec.json.Encoder()
+    _STATS_DECODER = msgspec.json.Decoder(dict)
+
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        data = _ENCODER.encode(obj)
+        return msgspec.json.format(data, indent=2) if pretty else data
+
+    _loads = _STATS_DECODER.decode
+except ImportError:
+    try:
+        import orjson
+
+        def _dumps(obj, pretty: bool = False) -> bytes:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+        _loads = orjson.loads
+    except ImportError:
+        def _dumps(obj, pretty: bool = False) -> bytes:
+            if pretty:
+                return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+            return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+        _loads = json.loads
+
+@dataclass(slots=True)
+class LevelStat:
+    """Per-difficulty question/correct counters"""
+    questions: int = 0
+    correct: int = 0
+
+
+def _default_levels() -> Dict[str, LevelStat]:
+    return {'easy': LevelStat(), 'medium': LevelStat(), 'hard': LevelStat()}
+
+
+def _inflate_levels(stats: Dict) -> Dict:
+    """Replace serialized level_statistics dicts with LevelStat instances"""
+    levels = stats.get('level_statistics')
+    if isinstance(levels, dict):
+        stats['level_statistics'] = {
+            name: stat if isinstance(stat, LevelStat) else LevelStat(**stat)
+            for name, stat in levels.items()
+        }
+    return stats
+
+
+def _deflate_levels(stats: Dict) -> Dict:
+    """Shallow-copy stats with level_statistics back as plain dicts for JSON"""
+    levels = stats.get('level_statistics')
+    if levels and isinstance(next(iter(levels.values()), None), LevelStat):
+        stats = dict(stats)
+        stats['level_statistics'] = {name: asdict(stat) for name, stat in levels.items()}
+    return stats
+
+
+def _serialize(stats: Dict, pretty: bool = False) -> bytes:
+    """Encode a stats dict to JSON bytes ready for a single write"""
+    return _dumps(_deflate_levels(stats), pretty=pretty)
+
+
+# Frozen template for a fresh stats dict; _get_initial_stats deep-copies it
+# and stamps in the timestamps
+_INITIAL_TEMPLATE = {
+    'current_level': 'easy',
+    'questions_answered': 0,
+    'correct_answers': 0,
+    'total_score': 0,
+    'sessions_played': 0,
+    'best_accuracy': 0.0,
+    'level_statistics': _default_levels()
+}
+
+
 class UserProgress:
     def __init__(self):
         self.data_dir = "data"
         self.stats_file = "user_stats.json"
         self.stats_path = os.path.join(self.data_dir, self.stats_file)
-        
+
+        # Parsed stats cache; _cache_mtime records the file mtime the cache
+        # reflects so external edits are still picked up
+        self._cache: Optional[Dict] = None
+        self._cache_mtime: float = 0.0
+        self._summary: Optional[Dict] = None  # Memoized get_user_summary result
+
+        # Digest of the last snapshot saved, used to drop no-change saves
+        self._last_saved_digest = None
+
+        # Saves accumulate in the cache and are flushed to disk in batches
+        self._dirty = False
+        self._pending_writes = 0
+        self._flush_threshold = 10  # Flush after this many saves...
+        self._flush_interval = 30.0  # ...or this many seconds, whichever first
+        self._last_flush = time.monotonic()
+        # When True, flushes fsync before renaming; off by default since the
+        # atomic rename already guarantees a consistent file
+        self.durable = False
+
         # Ensure data directory exists
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
-    
+        os.makedirs(self.data_dir, exist_ok=True)
+
+        # Whatever is still pending when the game closes gets written out
+        atexit.register(self._flush_to_disk)
+
     def load_stats(self) -> Optional[Dict]:
-        """Load user statistics from file"""
+        """Load user statistics, reading the file only when it has changed"""
         try:
-            if os.path.exists(self.stats_path):
-                with open(self.stats_path, 'r', encoding='utf-8') as file:
-                    return json.load(file)
-            else:
+            # A dirty cache holds saves the file doesn't have yet
+            if self._dirty and self._cache is not None:
+                return self._cache
+
+            # With a warm cache, one stat decides whether the parse is stale
+            if self._cache is not None:
+                try:
+                    if os.stat(self.stats_path).st_mtime == self._cache_mtime:
+                        return self._cache
+                except FileNotFoundError:
+                    pass
+
+            # Cold or stale: open directly and fstat the handle rather than
+            # stat-ing the path before opening it
+            try:
+                with open(self.stats_path, 'rb') as file:
+                    self._cache_mtime = os.fstat(file.fileno()).st_mtime
+                    self._cache = _inflate_levels(_loads(file.read()))
+                self._summary = None
+                return self._cache
+            except FileNotFoundError:
                 # Create initial stats file
                 initial_stats = self._get_initial_stats()
                 self.save_stats(initial_stats)
+                self._flush_to_disk()
                 return initial_stats
-                
-        except Exception as e:
+
+        except (OSError, ValueError) as e:
             print(f"Error loading user stats: {str(e)}")
             return None
     
     def save_stats(self, stats: Dict) -> bool:
         """Save user statistics to file"""
         try:
-            # Add timestamp
-            stats['last_updated'] = datetime.now().isoformat()
-            
-            # Load existing stats to preserve history
-            existing_stats = {}
-            if os.path.exists(self.stats_path):
-                try:
-                    with open(self.stats_path, 'r', encoding='utf-8') as file:
-                        existing_stats = json.load(file)
-                except:
-                    pass
-            
-            # Update with new stats
-            updated_stats = self._merge_stats(existing_stats, stats)
-            
-            # Save to file
-            with open(self.stats_path, 'w', encoding='utf-8') as file:
-                json.dump(updated_stats, file, indent=2, ensure_ascii=False)
-            
+            # Add timestamp (computed once and reused through the merge)
+            now_iso = datetime.now().isoformat()
+            stats['last_updated'] = now_iso
+
+            # A snapshot identical to the last one saved carries nothing new:
+            # refresh the timestamp and skip the counters and the disk
+            digest = (stats.get('current_level'), stats.get('questions_answered', 0),
+                      stats.get('correct_answers', 0), stats.get('total_score', 0))
+            if digest == self._last_saved_digest and self._cache is not None:
+                self._cache['last_updated'] = now_iso
+                return True
+
+            cache = self._cache
+            if cache is None:
+                # Cold start: reconcile once against whatever is on disk;
+                # after this every save is in-place counter arithmetic
+                self._cache = self._merge_stats(self._load_from_disk(), stats, now_iso)
+            else:
+                # Hot path: bump the running totals directly in the live dict
+                n_qa = stats.get('questions_answered', 0)
+                questions_answered = cache.get('questions_answered', 0) + n_qa
+                correct_answers = cache.get('correct_answers', 0) + stats.get('correct_answers', 0)
+
+                cache['current_level'] = stats.get('current_level',
+                                                   cache.get('current_level', 'easy'))
+                cache['questions_answered'] = questions_answered
+                cache['correct_answers'] = correct_answers
+                cache['total_score'] = cache.get('total_score', 0) + stats.get('total_score', 0)
+                if n_qa > 0:
+                    cache['sessions_played'] = cache.get('sessions_played', 0) + 1
+                if questions_answered > 0:
+                    current_accuracy = (correct_answers / questions_answered) * 100
+                    cache['best_accuracy'] = max(cache.get('best_accuracy', 0), current_accuracy)
+                cache['last_updated'] = now_iso
+
+            self._last_saved_digest = digest
+            self._summary = None
+            self._dirty = True
+            self._pending_writes += 1
+
+            if (self._pending_writes >= self._flush_threshold
+                    or time.monotonic() - self._last_flush >= self._flush_interval):
+                return self._flush_to_disk()
+
             return True
-            
-        except Exception as e:
+
+        except (OSError, TypeError, ValueError) as e:
             print(f"Error saving user stats: {str(e)}")
             return False
-    
+
+    def _flush_to_disk(self) -> bool:
+        """Atomically write the cached stats out to the stats file"""
+        if not self._dirty or self._cache is None:
+            return True
+
+        try:
+            # Write to a sibling temp file and rename over the target so a
+            # crash mid-write can never leave a torn stats file behind
+            tmp_path = self.stats_path + ".tmp"
+            with open(tmp_path, 'wb', buffering=1 << 16) as file:
+                file.write(_serialize(self._cache))
+                if self.durable:
+                    file.flush()
+                    os.fsync(file.fileno())
+            os.replace(tmp_path, self.stats_path)
+            self._cache_mtime = os.stat(self.stats_path).st_mtime
+            self._dirty = False
+            self._pending_writes = 0
+            self._last_flush = time.monotonic()
+
+            return True
+
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Error saving user stats: {str(e)}")
+            return False
+
+    def _load_from_disk(self) -> Dict:
+        """Read and parse the stats file; used only when the cache is cold"""
+        try:
+            with open(self.stats_path, 'rb') as file:
+                # Map larger files and parse in place, skipping the userspace
+                # copy; below a page the mmap setup costs more than it saves
+                if os.fstat(file.fileno()).st_size >= mmap.PAGESIZE:
+                    mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        view = memoryview(mm)
+                        try:
+                            return _inflate_levels(_loads(view))
+                        except TypeError:
+                            # stdlib json can't take a buffer; copy once
+                            return _inflate_levels(_loads(view.tobytes()))
+                        finally:
+                            view.release()
+                    finally:
+                        mm.close()
+                return _inflate_levels(_loads(file.read()))
+        except (OSError, TypeError, ValueError):
+            return {}
+
     def _get_initial_stats(self) -> Dict:
         """Get initial user statistics"""
-        return {
-            'current_level': 'easy',
-            'questions_answered': 0,
-            'correct_answers': 0,
-            'total_score': 0,
-            'sessions_played': 0,
-            'best_accuracy': 0.0,
-            'level_statistics': {
-                'easy': {'questions': 0, 'correct': 0},
-                'medium': {'questions': 0, 'correct': 0},
-                'hard': {'questions': 0, 'correct': 0}
-            },
-            'created_date': datetime.now().isoformat(),
-            'last_updated': datetime.now().isoformat()
-        }
+        stats = copy.deepcopy(_INITIAL_TEMPLATE)
+        now_iso = datetime.now().isoformat()
+        stats['created_date'] = now_iso
+        stats['last_updated'] = now_iso
+        return stats
     
-    def _merge_stats(self, existing: Dict, new: Dict) -> Dict:
-        """Merge new statistics with existing ones"""
-        # Start with existing stats
-        merged = existing.copy()
-        
-        # Update basic stats
-        merged['current_level'] = new.get('current_level', existing.get('current_level', 'easy'))
-        merged['questions_answered'] = existing.get('questions_answered', 0) + new.get('questions_answered', 0)
-        merged['correct_answers'] = existing.get('correct_answers', 0) + new.get('correct_answers', 0)
-        merged['total_score'] = existing.get('total_score', 0) + new.get('total_score', 0)
-        
+    def _merge_stats(self, existing: Dict, new: Dict, now_iso: str) -> Dict:
+        """Reconcile a session snapshot with on-disk stats (cold start only)"""
+        # Hoist each key's value into a local once instead of re-hashing the
+        # same keys across the .get() calls below
+        e_level = existing.get('current_level', 'easy')
+        e_qa = existing.get('questions_answered', 0)
+        e_ca = existing.get('correct_answers', 0)
+        e_ts = existing.get('total_score', 0)
+        e_sp = existing.get('sessions_played', 0)
+        e_ba = existing.get('best_accuracy', 0)
+        n_qa = new.get('questions_answered', 0)
+
+        # Collect the updated fields, then overlay them on the existing stats
+        # with one C-level dict merge instead of key-by-key assignment
+        questions_answered = e_qa + n_qa
+        correct_answers = e_ca + new.get('correct_answers', 0)
+        derived = {
+            'current_level': new.get('current_level', e_level),
+            'questions_answered': questions_answered,
+            'correct_answers': correct_answers,
+            'total_score': e_ts + new.get('total_score', 0),
+            'last_updated': new.get('last_updated', now_iso)
+        }
+
         # Increment sessions if this is a new session
-        if new.get('questions_answered', 0) > 0:
-            merged['sessions_played'] = existing.get('sessions_played', 0) + 1
-        
+        if n_qa > 0:
+            derived['sessions_played'] = e_sp + 1
+
         # Update best accuracy
-        if merged['questions_answered'] > 0:
-            current_accuracy = (merged['correct_answers'] / merged['questions_answered']) * 100
-            merged['best_accuracy'] = max(existing.get('best_accuracy', 0), current_accuracy)
-        
+        if questions_answered > 0:
+            current_accuracy = (correct_answers / questions_answered) * 100
+            derived['best_accuracy'] = max(e_ba, current_accuracy)
+
         # Update level statistics (simplified for now)
-        if 'level_statistics' not in merged:
-            merged['level_statistics'] = {
-                'easy': {'questions': 0, 'correct': 0},
-                'medium': {'questions': 0, 'correct': 0},
-                'hard': {'questions': 0, 'correct': 0}
-            }
-        
-        # Update timestamp
-        merged['last_updated'] = new.get('last_updated', datetime.now().isoformat())
-        
-        return merged
+        if 'level_statistics' not in existing:
+            derived['level_statistics'] = _default_levels()
+
+        return existing | derived
     
     def get_user_summary(self) -> Dict:
         """Get a summary of user progress"""
+        # The summary only changes when the stats do, so rebuild it lazily
+        # and hand back the memoized dict in between
+        if self._summary is not None:
+            return self._summary
+
         stats = self.load_stats()
         if not stats:
             return {}
-        
+
         summary = {
             'total_questions': stats.get('questions_answered', 0),
             'total_correct': stats.get('correct_answers', 0),
@@ -130,7 +329,8 @@ class UserProgress:
         
         if summary['total_questions'] > 0:
             summary['overall_accuracy'] = (summary['total_correct'] / summary['total_questions']) * 100
-        
+
+        self._summary = summary
         return summary
     
     def reset_stats(self) -> bool:
@@ -138,19 +338,22 @@ class UserProgress:
         try:
             initial_stats = self._get_initial_stats()
             return self.save_stats(initial_stats)
-        except Exception as e:
+        except (OSError, TypeError, ValueError) as e:
             print(f"Error resetting stats: {str(e)}")
             return False
     
     def export_stats(self, filepath: str) -> bool:
         """Export user statistics to a specified file"""
         try:
-            stats = self.load_stats()
+            # The cache is authoritative while the game runs; only fall back
+            # to a real load when it hasn't been populated yet
+            stats = self._cache if self._cache is not None else self.load_stats()
             if stats:
-                with open(filepath, 'w', encoding='utf-8') as file:
-                    json.dump(stats, file, indent=2, ensure_ascii=False)
+                # Exports are for people to read, so keep those pretty-printed
+                with open(filepath, 'wb', buffering=1 << 16) as file:
+                    file.write(_serialize(stats, pretty=True))
                 return True
             return False
-        except Exception as e:
+        except (OSError, TypeError, ValueError) as e:
             print(f"Error exporting stats: {str(e)}")
             return False